@@ -1,12 +1,14 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response, JSONResponse
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from typing import Dict, Any
 import logging
 
+from app.core.responses import MSGPACK_OPENAPI_RESPONSE, ResponseFormat
 from app.llm.chains import get_presentation_chain, get_slide_modification_chain
 from app.schemas.presentation import (
     PresentationRequest, 
     Presentation, 
+    PresentationBase64Response,
     SlideModificationRequest, 
     SlideModificationResponse,
     ErrorResponse
@@ -15,10 +17,12 @@ from app.services.ppt_service import PPTService
 
 router = APIRouter()
 
-@router.post("/generate", response_model=Presentation)
-async def generate_presentation(request: PresentationRequest):
+@router.post("/generate", response_model=Presentation, responses=MSGPACK_OPENAPI_RESPONSE)
+async def generate_presentation(request: PresentationRequest, response_format: ResponseFormat = Depends()):
     """
     Generate a structured presentation from input text
+    
+    Responds with MessagePack when the client sends Accept: application/msgpack
     """
     if not request.text.strip():
         raise HTTPException(status_code=400, detail="Input text cannot be empty")
@@ -32,15 +36,17 @@ async def generate_presentation(request: PresentationRequest):
         if isinstance(result, dict) and "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
             
-        return result
+        return response_format.render(Presentation, result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/modify-slide", response_model=SlideModificationResponse)
-async def modify_slide(request: SlideModificationRequest):
+@router.post("/modify-slide", response_model=SlideModificationResponse, responses=MSGPACK_OPENAPI_RESPONSE)
+async def modify_slide(request: SlideModificationRequest, response_format: ResponseFormat = Depends()):
     """
     Modify a specific slide based on user instructions
+    
+    Responds with MessagePack when the client sends Accept: application/msgpack
     """
     if not request.user_prompt.strip():
         raise HTTPException(status_code=400, detail="Modification instructions cannot be empty")
@@ -63,10 +69,10 @@ async def modify_slide(request: SlideModificationRequest):
             raise HTTPException(status_code=500, detail=result["error"])
         
         # Return the modified slide
-        return {
+        return response_format.render(SlideModificationResponse, {
             "slide_id": result["slide_id"],
             "modified_slide": result
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -104,10 +110,13 @@ async def download_presentation(request: PresentationRequest):
 
 # PDF endpoint removed as requested
 
-@router.post("/presentation-base64")
-async def get_presentation_base64(request: PresentationRequest):
+@router.post("/presentation-base64", response_model=PresentationBase64Response, responses=MSGPACK_OPENAPI_RESPONSE)
+async def get_presentation_base64(request: PresentationRequest, response_format: ResponseFormat = Depends()):
     """
     Generate presentation data with a base64-encoded PowerPoint file
+    
+    When the client sends Accept: application/msgpack the file is returned as raw
+    bytes under "pptx" instead of "pptx_base64", avoiding the base64 overhead
     """
     if not request.text.strip():
         raise HTTPException(status_code=400, detail="Input text cannot be empty")
@@ -121,16 +130,19 @@ async def get_presentation_base64(request: PresentationRequest):
         if isinstance(presentation_data, dict) and "error" in presentation_data:
             raise HTTPException(status_code=500, detail=presentation_data["error"])
             
-        # Generate base64 encoded PPTX
-        base64_pptx = PPTService.get_presentation_base64(presentation_data)
+        # MessagePack carries binary natively, so skip base64 for it
+        if response_format.msgpack:
+            return response_format.render(
+                Presentation,
+                presentation_data,
+                pptx=PPTService.get_presentation_bytes(presentation_data)
+            )
         
-        # Add base64 data to the response
-        response_data = {
-            **presentation_data,
-            "pptx_base64": base64_pptx
-        }
-        
-        return JSONResponse(content=response_data)
+        return response_format.render(
+            PresentationBase64Response,
+            presentation_data,
+            pptx_base64=PPTService.get_presentation_base64(presentation_data)
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,139 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional
+import gzip
+import zstandard
+
+from app.core.headers import parse_quality_values
+
+# Payloads that are already compressed gain nothing from a second pass
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "application/vnd.openxmlformats",
+    "application/zip",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+# Preferred order when the client accepts several encodings equally
+SUPPORTED_ENCODINGS = ("zstd", "gzip")
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported content coding from an Accept-Encoding header
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        "zstd", "gzip" or None if neither is acceptable
+    """
+    qualities = parse_quality_values(accept_encoding)
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing complete response bodies with zstd or gzip
+
+    Bodies smaller than minimum_size, streamed responses, responses that already
+    carry a Content-Encoding and already-compressed media types are sent unchanged.
+    Every response that could have been compressed gets Vary: Accept-Encoding.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_compressor = zstandard.ZstdCompressor(level=zstd_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Optional[Message] = None
+        started = False
+
+        async def send_start(compressible: bool) -> None:
+            nonlocal started
+            if compressible:
+                # Caches must key on Accept-Encoding whether or not this body was compressed
+                MutableHeaders(raw=start_message["headers"]).add_vary_header("Accept-Encoding")
+            started = True
+            await send(start_message)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if started:
+                await send(message)
+                return
+
+            compressible = self._is_compressible(MutableHeaders(raw=start_message["headers"]))
+            if message["type"] != "http.response.body":
+                # e.g. http.response.pathsend, which must still follow the start message
+                await send_start(compressible)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if (
+                encoding is None
+                or not compressible
+                or message.get("more_body", False)
+                or len(body) < self.minimum_size
+            ):
+                # Streamed, small or unsuitable responses are forwarded as-is
+                await send_start(compressible)
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            await send_start(compressible)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _is_compressible(headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """
+        Compress a response body with the given content coding
+
+        Args:
+            body: Uncompressed response body
+            encoding: "zstd" or "gzip"
+
+        Returns:
+            Compressed bytes
+        """
+        if encoding == "zstd":
+            return self.zstd_compressor.compress(body)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
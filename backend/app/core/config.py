@@ -18,6 +18,11 @@ class Settings(BaseSettings):
     # CORS settings
     CORS_ORIGINS: list = ["*"]
     
+    # Response compression settings
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESSION_LEVEL: int = 6
+    ZSTD_COMPRESSION_LEVEL: int = 3
+    
     # Define environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "dev")
     
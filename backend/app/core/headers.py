@@ -0,0 +1,34 @@
+from typing import Dict
+
+
+def parse_quality_values(header: str) -> Dict[str, float]:
+    """
+    Parse a comma-separated header with q-values such as Accept or Accept-Encoding
+
+    Every ";"-separated parameter is inspected so q may appear in any position;
+    other parameters are ignored. Entries without q default to 1.0 and entries
+    with a malformed q are treated as not acceptable.
+
+    Args:
+        header: Raw header value
+
+    Returns:
+        Mapping of lower-cased token (media type or coding) to its quality
+    """
+    qualities: Dict[str, float] = {}
+    for entry in header.split(","):
+        token, *params = entry.split(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() != "q":
+                continue
+            try:
+                quality = min(max(float(value.strip()), 0.0), 1.0)
+            except ValueError:
+                quality = 0.0
+        qualities[token] = max(quality, qualities.get(token, 0.0))
+    return qualities
@@ -0,0 +1,82 @@
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from typing import Any, Dict, Type
+import msgpack
+
+from app.core.headers import parse_quality_values
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+# OpenAPI entry for routes that can also answer in MessagePack
+MSGPACK_OPENAPI_RESPONSE: Dict[int, Dict[str, Any]] = {
+    200: {
+        "content": {MSGPACK_MEDIA_TYPE: {}},
+        "description": "Same payload encoded as MessagePack when requested via the Accept header",
+    }
+}
+
+
+class MsgPackResponse(Response):
+    """
+    Response rendered as MessagePack instead of JSON
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+def wants_msgpack(request: Request) -> bool:
+    """
+    Check whether the client prefers MessagePack over JSON via the Accept header
+
+    Args:
+        request: Incoming HTTP request
+
+    Returns:
+        True only if a MessagePack media type ranks strictly above JSON
+    """
+    qualities = parse_quality_values(request.headers.get("accept", ""))
+    msgpack_quality = max(qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    json_quality = max(
+        qualities.get("application/json", 0.0),
+        qualities.get("application/*", 0.0),
+        qualities.get("*/*", 0.0),
+    )
+    return msgpack_quality > json_quality
+
+
+class ResponseFormat:
+    """
+    FastAPI dependency negotiating between JSON and MessagePack for a route
+
+    JSON bodies are left to the route's response_model so FastAPI can dump them
+    straight to bytes with Pydantic. Both formats carry Vary: Accept.
+    """
+
+    VARY_HEADERS = {"Vary": "Accept"}
+
+    def __init__(self, request: Request, response: Response):
+        self.msgpack = wants_msgpack(request)
+        # Only reaches responses rendered by FastAPI, i.e. the JSON path
+        response.headers.update(self.VARY_HEADERS)
+
+    def render(self, model: Type[BaseModel], content: Dict[str, Any], **extra: Any) -> Any:
+        """
+        Render route output in the negotiated format
+
+        Args:
+            model: Schema the payload must match; applied here for MessagePack and
+                by the route's response_model for JSON
+            content: Route output
+            **extra: Additional fields, e.g. binary data that only MessagePack carries
+
+        Returns:
+            The content for response_model, or a MsgPackResponse
+        """
+        if not self.msgpack:
+            return {**content, **extra}
+        payload = {**model.model_validate(content).model_dump(), **extra}
+        return MsgPackResponse(content=payload, headers=self.VARY_HEADERS)
@@ -20,6 +20,10 @@ class Presentation(BaseModel):
     title: str = Field(..., description="Presentation title")
     slides: List[Slide] = Field(default_factory=list, description="List of slides")
     
+class PresentationBase64Response(Presentation):
+    """Schema for a presentation with its base64-encoded PowerPoint file"""
+    pptx_base64: str = Field(..., description="Base64-encoded PPTX file")
+    
 class SlideModificationRequest(BaseModel):
     """Schema for slide modification request"""
     slide_id: str = Field(..., description="ID of the slide to modify")
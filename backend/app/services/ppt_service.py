@@ -148,8 +148,21 @@ class PPTService:
         Returns:
             Base64 encoded string of the PPTX file
         """
-        pptx_bytes = PPTService.create_presentation(presentation_data)
-        encoded = base64.b64encode(pptx_bytes.getvalue()).decode('utf-8')
+        encoded = base64.b64encode(PPTService.get_presentation_bytes(presentation_data)).decode('utf-8')
         return encoded
 
+    @staticmethod
+    def get_presentation_bytes(presentation_data: Dict[str, Any]) -> bytes:
+        """
+        Generate the raw bytes of the PowerPoint presentation
+        
+        Args:
+            presentation_data: Dictionary with presentation data
+            
+        Returns:
+            Raw bytes of the PPTX file
+        """
+        pptx_bytes = PPTService.create_presentation(presentation_data)
+        return pptx_bytes.getvalue()
+
     # PDF creation method removed as requested
@@ -0,0 +1,116 @@
+"""
+Benchmark serialization CPU time and bytes on the wire for presentation responses
+
+Requests go through the real app, middleware included, with the LLM chain and
+PPTX generation replaced by precomputed results so the timings cover response
+rendering and compression only. Run from the backend directory:
+    python -m benchmarks.serialization_benchmark
+"""
+import argparse
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from main import app
+from app.api.routes import presentation
+from app.services.ppt_service import PPTService
+
+ROUTES = ("/generate", "/presentation-base64")
+ACCEPT = {"json": "application/json", "msgpack": "application/msgpack"}
+ACCEPT_ENCODING = ("identity", "gzip", "zstd")
+
+
+def build_deck(slide_count: int, bullets_per_slide: int) -> Dict[str, Any]:
+    """Build a synthetic presentation shaped like the LLM chain output"""
+    return {
+        "title": f"Benchmark Deck with {slide_count} Slides",
+        "slides": [
+            {
+                "title": f"Slide {i + 1}: Key Findings and Next Steps",
+                "bullets": [
+                    {"text": f"Point {j + 1} explaining an aspect of topic {i + 1} in a full sentence"}
+                    for j in range(bullets_per_slide)
+                ],
+                "slide_id": f"slide{i + 1}",
+            }
+            for i in range(slide_count)
+        ],
+    }
+
+
+class StubChain:
+    def __init__(self, result: Dict[str, Any]):
+        self.result = result
+
+    def invoke(self, _: Any) -> Dict[str, Any]:
+        return self.result
+
+
+@contextmanager
+def stubbed_generation(deck: Dict[str, Any]) -> Iterator[None]:
+    """Serve deck from the chain and reuse one generated PPTX for every request"""
+    pptx_bytes = PPTService.get_presentation_bytes(deck)
+    pptx_base64 = PPTService.get_presentation_base64(deck)
+    with patch.object(presentation, "get_presentation_chain", lambda: StubChain(deck)), \
+            patch.object(PPTService, "get_presentation_bytes", staticmethod(lambda _: pptx_bytes)), \
+            patch.object(PPTService, "get_presentation_base64", staticmethod(lambda _: pptx_base64)):
+        yield
+
+
+def run(iterations: int) -> List[Tuple[str, str, str, str, float, str, int]]:
+    decks = {
+        "small": build_deck(slide_count=5, bullets_per_slide=4),
+        "large": build_deck(slide_count=60, bullets_per_slide=6),
+    }
+    client = TestClient(app)
+
+    rows = []
+    for deck_name, deck in decks.items():
+        with stubbed_generation(deck):
+            for route in ROUTES:
+                for format_name, accept in ACCEPT.items():
+                    for accept_encoding in ACCEPT_ENCODING:
+                        headers = {"Accept": accept, "Accept-Encoding": accept_encoding}
+
+                        def send():
+                            # Stream so the client does not decode the body; lengths are wire bytes
+                            with client.stream(
+                                "POST", f"/api/v1/presentation{route}", json={"text": "benchmark"}, headers=headers
+                            ) as response:
+                                response.raise_for_status()
+                                return response.headers, b"".join(response.iter_raw())
+
+                        response_headers, body = send()
+                        start = time.process_time()
+                        for _ in range(iterations):
+                            send()
+                        cpu_ms = (time.process_time() - start) * 1000 / iterations
+
+                        rows.append((
+                            deck_name,
+                            route,
+                            format_name,
+                            accept_encoding,
+                            cpu_ms,
+                            response_headers.get("content-encoding", "-"),
+                            int(response_headers.get("content-length", len(body))),
+                        ))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50, help="Requests per measurement")
+    args = parser.parse_args()
+
+    header = ("deck", "route", "format", "accept-enc", "cpu ms", "encoding", "wire B")
+    print("{:<6} {:<21} {:<8} {:<10} {:>8} {:<8} {:>10}".format(*header))
+    for row in run(args.iterations):
+        print("{:<6} {:<21} {:<8} {:<10} {:>8.3f} {:<8} {:>10}".format(*row))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import logging
 from dotenv import load_dotenv
 
 from app.api.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 
 # Load environment variables
@@ -34,6 +35,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses above the size threshold (zstd or gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_COMPRESSION_LEVEL,
+    zstd_level=settings.ZSTD_COMPRESSION_LEVEL,
+)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -0,0 +1,110 @@
+import asyncio
+import gzip
+
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware
+
+LARGE_BODY = "slide " * 500
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(LARGE_BODY.encode()), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/pptx")
+    def pptx():
+        return Response(LARGE_BODY.encode(), media_type=PPTX_MEDIA_TYPE)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([LARGE_BODY, LARGE_BODY]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def get_raw(client: TestClient, path: str, accept_encoding: str):
+    # Disable httpx's transparent decoding so the wire bytes can be inspected
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_compresses_with_zstd():
+    response, body = get_raw(make_client(), "/large", "gzip, zstd")
+    assert response.headers["content-encoding"] == "zstd"
+    assert response.headers["content-length"] == str(len(body))
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert zstandard.ZstdDecompressor().decompress(body).decode() == LARGE_BODY
+
+
+def test_compresses_with_gzip():
+    response, body = get_raw(make_client(), "/large", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == LARGE_BODY
+
+
+def test_below_threshold_is_not_compressed_but_varies():
+    response, body = get_raw(make_client(), "/small", "gzip, zstd")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert body == b"tiny"
+
+
+def test_no_acceptable_encoding_still_varies():
+    response, body = get_raw(make_client(), "/large", "identity")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert body.decode() == LARGE_BODY
+
+
+def test_already_encoded_is_untouched():
+    response, body = get_raw(make_client(), "/encoded", "zstd")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "vary" not in response.headers
+    assert gzip.decompress(body).decode() == LARGE_BODY
+
+
+def test_incompressible_type_is_untouched():
+    response, body = get_raw(make_client(), "/pptx", "gzip, zstd")
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert body.decode() == LARGE_BODY
+
+
+def test_streamed_body_is_passed_through():
+    response, body = get_raw(make_client(), "/stream", "gzip, zstd")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert body.decode() == LARGE_BODY * 2
+
+
+def test_start_is_sent_before_pathsend():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.pathsend", "path": "/tmp/deck.txt"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(app)(scope, None, send))
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.pathsend"]
+    assert (b"vary", b"Accept-Encoding") in sent[0]["headers"]
@@ -0,0 +1,48 @@
+from starlette.requests import Request
+
+from app.core.compression import select_encoding
+from app.core.headers import parse_quality_values
+from app.core.responses import wants_msgpack
+
+
+def make_request(accept: str) -> Request:
+    return Request({"type": "http", "headers": [(b"accept", accept.encode("latin-1"))]})
+
+
+def test_parse_quality_values_defaults_to_one():
+    assert parse_quality_values("gzip, ZSTD") == {"gzip": 1.0, "zstd": 1.0}
+
+
+def test_parse_quality_values_reads_q_from_any_parameter():
+    assert parse_quality_values("gzip; q=0.8; level=1") == {"gzip": 0.8}
+    assert parse_quality_values("gzip;level=1;q=0.5") == {"gzip": 0.5}
+    assert parse_quality_values("application/msgpack; charset=x; q=0") == {"application/msgpack": 0.0}
+
+
+def test_parse_quality_values_malformed_q_is_not_acceptable():
+    assert parse_quality_values("gzip;q=abc") == {"gzip": 0.0}
+
+
+def test_select_encoding_prefers_zstd_on_tie():
+    assert select_encoding("gzip, deflate, br, zstd") == "zstd"
+
+
+def test_select_encoding_ranks_by_quality():
+    assert select_encoding("zstd;q=0.5, gzip; q=0.8; level=1") == "gzip"
+    assert select_encoding("gzip;level=1;q=0.5") == "gzip"
+
+
+def test_select_encoding_wildcard_and_exclusions():
+    assert select_encoding("*") == "zstd"
+    assert select_encoding("*, zstd;q=0") == "gzip"
+    assert select_encoding("gzip;q=0, identity") is None
+    assert select_encoding("") is None
+
+
+def test_wants_msgpack_only_when_it_outranks_json():
+    assert wants_msgpack(make_request("application/msgpack"))
+    assert wants_msgpack(make_request("application/json;q=0.5, application/x-msgpack"))
+    assert not wants_msgpack(make_request("application/json, application/msgpack;q=0.1"))
+    assert not wants_msgpack(make_request("application/msgpack, */*"))
+    assert not wants_msgpack(make_request("application/msgpack; charset=x; q=0"))
+    assert not wants_msgpack(make_request(""))
@@ -0,0 +1,100 @@
+import base64
+from unittest.mock import patch
+
+import msgpack
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.api.routes import presentation
+
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+SLIDE = {"title": "Why AI", "bullets": [{"text": "It learns from data"}], "slide_id": "slide1"}
+DECK = {"title": "AI in Daily Life", "slides": [SLIDE]}
+
+
+class StubChain:
+    def __init__(self, result):
+        self.result = result
+
+    def invoke(self, _):
+        return self.result
+
+
+@pytest.fixture
+def client():
+    # Extra keys must be dropped by the schema in both JSON and MessagePack
+    deck = {**DECK, "extra": "internal"}
+    slide = {**SLIDE, "extra": "internal"}
+    with patch.object(presentation, "get_presentation_chain", lambda: StubChain(deck)), \
+            patch.object(presentation, "get_slide_modification_chain", lambda: StubChain(slide)):
+        yield TestClient(app)
+
+
+def post(client, path, accept="application/json", accept_encoding="identity"):
+    if path == "/modify-slide":
+        body = {"slide_id": "slide1", "user_prompt": "Shorter", "current_content": SLIDE}
+    else:
+        body = {"text": "Explain AI"}
+    return client.post(
+        f"/api/v1/presentation{path}",
+        json=body,
+        headers={"Accept": accept, "Accept-Encoding": accept_encoding},
+    )
+
+
+def test_generate_json(client):
+    response = post(client, "/generate")
+    assert response.headers["content-type"] == "application/json"
+    assert "Accept" in response.headers["vary"]
+    assert response.json() == DECK
+
+
+def test_generate_msgpack(client):
+    response = post(client, "/generate", accept="application/json;q=0.5, application/msgpack")
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "Accept" in response.headers["vary"]
+    assert msgpack.unpackb(response.content) == DECK
+
+
+def test_generate_prefers_json_when_it_ranks_higher(client):
+    response = post(client, "/generate", accept="application/json, application/msgpack;q=0.1")
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_modify_slide_formats_match(client):
+    json_body = post(client, "/modify-slide").json()
+    msgpack_response = post(client, "/modify-slide", accept="application/msgpack")
+    assert msgpack_response.headers["content-type"] == "application/msgpack"
+    assert json_body == {"slide_id": "slide1", "modified_slide": SLIDE}
+    assert msgpack.unpackb(msgpack_response.content) == json_body
+
+
+def test_presentation_base64_json(client):
+    response = post(client, "/presentation-base64")
+    body = response.json()
+    assert "Accept" in response.headers["vary"]
+    assert set(body) == {"title", "slides", "pptx_base64"}
+    assert base64.b64decode(body["pptx_base64"])[:2] == b"PK"
+
+
+def test_presentation_base64_msgpack_sends_raw_bytes(client):
+    response = post(client, "/presentation-base64", accept="application/msgpack")
+    body = msgpack.unpackb(response.content)
+    assert response.headers["content-type"] == "application/msgpack"
+    assert set(body) == {"title", "slides", "pptx"}
+    assert isinstance(body["pptx"], bytes) and body["pptx"][:2] == b"PK"
+
+
+def test_presentation_base64_is_compressed(client):
+    response = post(client, "/presentation-base64", accept_encoding="gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_download_is_not_compressed(client):
+    response = post(client, "/download", accept_encoding="gzip, zstd")
+    assert response.headers["content-type"] == PPTX_MEDIA_TYPE
+    assert "content-encoding" not in response.headers
+    assert response.content[:2] == b"PK"